@@ -7,11 +7,21 @@ Implementa protocolos Stop & Wait y Go-Back-N con handshake
 
 __version__ = "1.0.0"
 
-# Importar clases base
-from .rdt_client import (
-    RdtClient, RdtHandshake, ConnectionState,
-    validate_file_size, calculate_file_hash, create_upload_request
-)
+# Las clases base se importan bajo demanda (PEP 562): `python -m client.upload`
+# importa este paquete y no debe pagar el costo de cargar rdt_client
+# (sockets, hashlib, protocolo) antes de validar los argumentos.
+_RDT_CLIENT_EXPORTS = frozenset({
+    'RdtClient', 'RdtHandshake', 'ConnectionState',
+    'validate_file_size', 'calculate_file_hash', 'create_upload_request'
+})
+
+
+def __getattr__(name):
+    if name in _RDT_CLIENT_EXPORTS:
+        from . import rdt_client
+        return getattr(rdt_client, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     
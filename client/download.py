@@ -5,10 +5,14 @@ Transfiere un archivo del servidor hacia el cliente
 """
 
 import argparse
-import socket
+import errno
 import os
+import stat
 import sys
 from pathlib import Path
+from typing import Optional
+
+from .protocols import PROTOCOLS
 
 def parse_args():
     """Parsea argumentos de línea de comandos"""
@@ -32,44 +36,55 @@ def parse_args():
     parser.add_argument("-n", "--name", required=True,
                         help="file name")
     parser.add_argument("-r", "--protocol", metavar="protocol",
-                        choices=["stop-and-wait", "go-back-n"], 
-                        default="stop-and-wait",
+                        choices=PROTOCOLS,
+                        default=PROTOCOLS[0],
                         help="error recovery protocol")
 
     return parser.parse_args()
 
-def validate_destination(dst_path: str) -> Path:
-    """Valida que el directorio destino existe y es escribible"""
+def validate_destination(dst_path: str, name: Optional[str] = None) -> Path:
+    """
+    Valida que el directorio destino existe y es escribible.
+
+    Si `dst_path` es un directorio y se pasa `name`, devuelve `dst_path / name`
+    reutilizando el mismo stat, sin volver a consultar el filesystem.
+    """
     dest_path = Path(dst_path)
-    
-    if dest_path.is_dir():
+
+    # Un único stat resuelve si el destino existe y si es directorio
+    try:
+        dest_mode = os.stat(dest_path).st_mode
+    except OSError as e:
+        if e.errno == errno.ENOTDIR:
+            # Un componente intermedio es un archivo (ej. archivo/x): no se puede crear
+            raise NotADirectoryError(f"Un componente de {dst_path} no es un directorio") from e
+        # Inexistente o bucle de symlinks: se trata como archivo a crear
+        if e.errno not in (errno.ENOENT, errno.ELOOP):
+            raise
+        dest_mode = None
+
+    if dest_mode is not None and stat.S_ISDIR(dest_mode):
         if not os.access(dest_path, os.W_OK):
             raise PermissionError(f"No se puede escribir en el directorio {dst_path}")
-        return dest_path
-    
+        return dest_path / name if name else dest_path
+
     parent_dir = dest_path.parent
-    if not parent_dir.exists():
-        raise FileNotFoundError(f"El directorio {parent_dir} no existe")
-    
     if not os.access(parent_dir, os.W_OK):
+        # Solo en el camino de error distinguimos inexistente de sin permisos
+        if not parent_dir.exists():
+            raise FileNotFoundError(f"El directorio {parent_dir} no existe")
         raise PermissionError(f"No se puede escribir en el directorio {parent_dir}")
-    
-    if dest_path.exists():
-        if not os.access(dest_path, os.W_OK):
-            raise PermissionError(f"No se puede sobreescribir el archivo {dst_path}")
-    
+
+    if dest_mode is not None and not os.access(dest_path, os.W_OK):
+        raise PermissionError(f"No se puede sobreescribir el archivo {dst_path}")
+
     return dest_path
 
 
 def download_file(args):
     """Implementa la lógica de download del archivo"""
     try:
-        destination = validate_destination(args.dst)
-        
-        if destination.is_dir():
-            target_file = destination / args.name
-        else:
-            target_file = destination
+        target_file = validate_destination(args.dst, args.name)
         
         if args.verbose:
             print(f"[VERBOSE] Iniciando download de {args.name}")
@@ -110,7 +125,7 @@ def download_file(args):
             print("Handshake falló")
             return False
 
-    except (FileNotFoundError, ValueError, PermissionError) as e:
+    except (FileNotFoundError, NotADirectoryError, ValueError, PermissionError) as e:
         print(f"Error: {e}")
         return False
     except Exception as e:
@@ -0,0 +1,16 @@
+"""
+Protocolos de recuperación de errores soportados.
+Módulo liviano: lo importan los CLI antes de cargar rdt_client.
+"""
+
+# Códigos de protocolo en el request de upload
+PROTO_STOP_WAIT, PROTO_GBN = 0, 1
+
+# Nombre en el CLI -> código en el protocolo
+PROTOCOL_CODES = {
+    "stop-and-wait": PROTO_STOP_WAIT,
+    "go-back-n": PROTO_GBN,
+}
+
+# Opciones de -r/--protocol; la primera es la default
+PROTOCOLS = tuple(PROTOCOL_CODES)
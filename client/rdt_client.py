@@ -5,15 +5,16 @@ Contiene las clases fundamentales compartidas por todos los protocolos.
 """
 
 import socket
-import threading
-import time
+from time import monotonic_ns
 import logging
 import hashlib
-from typing import Optional, Tuple, Dict, Any
+from types import MappingProxyType
+from typing import Optional, Tuple, Dict, Any, Mapping
 from pathlib import Path
-from protocol.rdt.rdt_message import RdtMessage, RdtRequest
-from protocol.dp.dp_request import DPRequest
+from protocol.rdt.rdt_message import RdtMessage, RdtRequest, FLAG_ACK, FLAG_DATA, FLAG_LAST, HEADER_SIZE
 from protocol import FunctionFlag
+from .protocols import PROTO_STOP_WAIT, PROTO_GBN, PROTOCOL_CODES
+from protocol.socket_helpers import SOCKET_RCVBUF_SIZE, SOCKET_SNDBUF_SIZE, set_socket_buffer
 # ================================[CONSTANTES DEL PROTOCOLO]===============================
 # Códigos de error
 ERR_TOO_BIG = 1          # Archivo excede el tamaño máximo
@@ -25,15 +26,6 @@ ERR_TIMEOUT_ERROR = 6    # Timeout
 ERR_INVALID_PROTOCOL = 7 # Protocolo no soportado
 ERR_SERVER_ERROR = 8     # Error interno del servidor
 
-# Constantes de protocolo
-PROTO_STOP_WAIT, PROTO_GBN = 0, 1
-
-# Tipos de mensaje y flags (consistentes con el servidor)
-# El servidor usa: FLAG_ACK = 1, FLAG_DATA = 0, FLAG_LAST = 2
-FLAG_ACK = 1        # Para ACK
-FLAG_DATA = 0       # Para datos
-FLAG_LAST = 2       # Para último paquete
-
 # Constantes TLV
 TLV_FILENAME = 0x01
 TLV_FILESIZE = 0x02
@@ -48,41 +40,52 @@ OP_REQUEST_UPLOAD, OP_UPLOAD_ACCEPTED = 0x01, 0x02
 OP_DOWNLOAD_ACCEPTED = 0x04
 OP_REQUEST_DOWNLOAD, OP_END_SESSION, OP_ERROR = 0x03, 0x10, 0x7F
 
+# Mensajes de error indexados por código (los códigos son densos: 1..8)
+_ERROR_MESSAGES = (
+    None,
+    "Archivo excede el tamaño máximo permitido",  # ERR_TOO_BIG
+    "Archivo no encontrado",                      # ERR_NOT_FOUND
+    "Solicitud malformada",                       # ERR_BAD_REQUEST
+    "Permisos insuficientes",                     # ERR_PERMISSION_DENIED
+    "Error de red",                               # ERR_NETWORK_ERROR
+    "Timeout en la operación",                    # ERR_TIMEOUT_ERROR
+    "Protocolo no soportado",                     # ERR_INVALID_PROTOCOL
+    "Error interno del servidor",                 # ERR_SERVER_ERROR
+)
+
 def get_error_message(error_code: int) -> str:
     """
     Obtiene el mensaje de error correspondiente al código.
-    
+
     Args:
         error_code (int): Código de error
-        
+
     Returns:
         str: Mensaje de error descriptivo
     """
-    error_messages = {
-        ERR_TOO_BIG: "Archivo excede el tamaño máximo permitido",
-        ERR_NOT_FOUND: "Archivo no encontrado",
-        ERR_BAD_REQUEST: "Solicitud malformada",
-        ERR_PERMISSION_DENIED: "Permisos insuficientes",
-        ERR_NETWORK_ERROR: "Error de red",
-        ERR_TIMEOUT_ERROR: "Timeout en la operación",
-        ERR_INVALID_PROTOCOL: "Protocolo no soportado",
-        ERR_SERVER_ERROR: "Error interno del servidor"
-    }
-    return error_messages.get(error_code, f"Error desconocido (código: {error_code})")
+    if 1 <= error_code < len(_ERROR_MESSAGES):
+        return _ERROR_MESSAGES[error_code]
+    return f"Error desconocido (código: {error_code})"
 
 # Configurar logging
 logger = logging.getLogger(__name__)
 
 # Constantes del protocolo
-BUFFER_SIZE = 2048
 HANDSHAKE_TIMEOUT = 5
 HANDSHAKE_MAX_ATTEMPTS = 3
 CHUNK_SIZE = 1024
+# Prefijo DP más largo: "{flag}_{uuid}_" con flag de un dígito y UUID textual de 36
+DP_PREFIX_MAX_SIZE = 1 + 1 + 36 + 1
+# Datagrama más grande que el protocolo puede enviar: header RDT + prefijo DP + chunk
+BUFFER_SIZE = HEADER_SIZE + DP_PREFIX_MAX_SIZE + CHUNK_SIZE
 ACK_TIMEOUT = 2
 MAX_RETRIES = 5
 WINDOW_SIZE_GO_BACK_N = 5
 MAX_FILE_SIZE_MB = 5  # Según consigna del trabajo
 
+# Prefijo DP de un CLOSE_CONN ("{function flag}_{uuid}_payload")
+_CLOSE_PREFIX = b"%d_" % FunctionFlag.CLOSE_CONN.value
+
 
 class RdtHandshake:
     """
@@ -121,7 +124,7 @@ class RdtHandshake:
             data=b''
         )
         
-        logger.info(f"Creando handshake request: window={self.max_window}, seq={self.sequence_number}")
+        logger.info("Creando handshake request: window=%s, seq=%s", self.max_window, self.sequence_number)
         return handshake_msg
     
     def parse_handshake_response(self, rdt_request: RdtRequest) -> bool:
@@ -135,33 +138,43 @@ class RdtHandshake:
             bool: True si el handshake fue exitoso, False en caso contrario
         """
         try:
-            if rdt_request.message.flag != FLAG_ACK:
-                logger.error(f"Flag incorrecto del servidor: {rdt_request.message.flag}, esperado: {FLAG_ACK} (ACK)")
-                return False
-            if not rdt_request.is_ack():
-                logger.error("El servidor no envió un ACK")
-                return False
-            
-            if rdt_request.get_max_window() != self.max_window:
-                logger.error(f"Max window no coincide: {rdt_request.get_max_window()}, esperado: {self.max_window}")
-                return False
-            
-            self.server_sequence_number = rdt_request.get_seq_num()
-            self.server_reference_number = rdt_request.get_ref_num()
-            self.reference_number = rdt_request.get_seq_num() + 1
-            
+            message = rdt_request.message
             expected_ref_num = self.sequence_number + 1
-            if self.server_reference_number != expected_ref_num:
-                logger.error(f"Reference number incorrecto: {self.server_reference_number}, esperado: {expected_ref_num}")
-                return False
-            
+            # Todas las validaciones juntas; los mensajes solo se arman si falla
+            if not (message.flag == FLAG_ACK
+                    and message.max_window == self.max_window
+                    and message.ref_num == expected_ref_num):
+                return self._log_handshake_failure(message, expected_ref_num)
+
+            self.server_sequence_number = message.seq_num
+            self.server_reference_number = message.ref_num
+            self.reference_number = message.seq_num + 1
             self.handshake_completed = True
             logger.info("Handshake completado exitosamente")
             return True
             
         except Exception as e:
-            logger.error(f"Error parseando respuesta de handshake: {e}")
+            logger.error("Error parseando respuesta de handshake: %s", e)
             return False
+
+    def _log_handshake_failure(self, message: RdtMessage, expected_ref_num: int) -> bool:
+        """
+        Loguea el primer chequeo que falló en la respuesta de handshake.
+
+        Args:
+            message (RdtMessage): Mensaje recibido del servidor
+            expected_ref_num (int): Reference number esperado
+
+        Returns:
+            bool: Siempre False, para devolverlo directamente
+        """
+        if message.flag != FLAG_ACK:
+            logger.error("Flag incorrecto del servidor: %s, esperado: %s (ACK)", message.flag, FLAG_ACK)
+        elif message.max_window != self.max_window:
+            logger.error("Max window no coincide: %s, esperado: %s", message.max_window, self.max_window)
+        else:
+            logger.error("Reference number incorrecto: %s, esperado: %s", message.ref_num, expected_ref_num)
+        return False
     
     def is_handshake_completed(self) -> bool:
         """Verifica si el handshake fue completado."""
@@ -192,7 +205,10 @@ class ConnectionState:
     Maneja el estado de la conexión después del handshake.
     Gestiona dinámicamente sequence numbers y reference numbers.
     """
-    
+
+    __slots__ = ('max_window', 'server_seq_num', 'server_ref_num',
+                 'client_seq_num', 'client_ref_num')
+
     def __init__(self, handshake_info: dict):
         """
         Inicializa el estado de la conexión basado en la información del handshake.
@@ -207,7 +223,8 @@ class ConnectionState:
         self.client_seq_num = 1
         self.client_ref_num = self.server_seq_num + 1
         
-        logger.info(f"Estado de conexión inicializado: client_seq={self.client_seq_num}, client_ref={self.client_ref_num} (basado en server_seq={self.server_seq_num})")
+        logger.info("Estado de conexión inicializado: client_seq=%s, client_ref=%s (basado en server_seq=%s)",
+                    self.client_seq_num, self.client_ref_num, self.server_seq_num)
     
     def get_next_sequence_number(self) -> int:
         """
@@ -232,7 +249,7 @@ class ConnectionState:
         Incrementa el sequence number después de enviar un mensaje exitosamente.
         """
         self.client_seq_num += 1
-        logger.debug(f"Sequence number incrementado a: {self.client_seq_num}")
+        logger.debug("Sequence number incrementado a: %s", self.client_seq_num)
     
     def update_reference_number(self, new_ref_num: int) -> None:
         """
@@ -242,7 +259,7 @@ class ConnectionState:
             new_ref_num (int): Nuevo reference number del ACK
         """
         self.client_ref_num = new_ref_num
-        logger.debug(f"Reference number actualizado a: {self.client_ref_num}")
+        logger.debug("Reference number actualizado a: %s", self.client_ref_num)
     
     def get_max_window(self) -> int:
         """
@@ -276,9 +293,22 @@ class RdtClient:
     """
     Cliente RDT con protocolo de handshake y manejo de errores.
     Maneja la comunicación completa con el servidor.
+
+    No usa locks: sendto sobre un socket UDP es atómico a nivel kernel y el
+    cliente tiene un único hilo emisor. Solo un escenario con varios hilos
+    escribiendo necesitaría serializar los contadores de stats.
+
+    Los contadores de estadísticas son atributos con __slots__ en lugar de
+    un dict, así cada incremento es un acceso por índice y no un hash.
     """
 
-    def __init__(self, host: str, port: int, max_window: int = 1):
+    __slots__ = ('host', 'port', '_peer', '_server_address', 'sock', '_rx_buf', '_rx_view', '_timeout',
+                 'closed_by_server', 'handshake', 'connected',
+                 'packets_sent', 'packets_received', 'retransmissions', 'errors',
+                 'start_time', 'end_time')
+
+    def __init__(self, host: str, port: int, max_window: int = 1,
+                 rcvbuf: int = SOCKET_RCVBUF_SIZE, sndbuf: int = SOCKET_SNDBUF_SIZE):
         """
         Inicializa el cliente RDT.
 
@@ -286,24 +316,63 @@ class RdtClient:
             host (str): IP del servidor.
             port (int): Puerto del servidor.
             max_window (int): Tamaño máximo de ventana (1 = stop and wait, 2-9 = go back N).
+            rcvbuf (int): Tamaño pedido para SO_RCVBUF, en bytes.
+            sndbuf (int): Tamaño pedido para SO_SNDBUF, en bytes.
         """
         self.host = host
         self.port = port
+        # Tupla de destino armada una vez. No se hace connect(): el servidor
+        # responde desde otro puerto efímero y el kernel descartaría esas respuestas
+        self._peer = (host, port)
+        self._server_address = f"{host}:{port}"  # Formato usado por RdtRequest
         self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
         self.sock.setblocking(True)
         self.sock.settimeout(HANDSHAKE_TIMEOUT)
-        self.lock = threading.Lock()
+        self._timeout = HANDSHAKE_TIMEOUT  # Último timeout aplicado al socket
+        self._configure_socket_buffers(rcvbuf, sndbuf)
+        self._configure_path_mtu_discovery()
+        # Buffer de recepción reutilizado entre llamadas a receive()
+        # Un byte de más: si se llena, el datagrama era más grande que BUFFER_SIZE
+        self._rx_buf = bytearray(BUFFER_SIZE + 1)
+        self._rx_view = memoryview(self._rx_buf)
         self.closed_by_server = False
         self.handshake = RdtHandshake(max_window)
         self.connected = False
-        self.stats = {
-            'packets_sent': 0,
-            'packets_received': 0,
-            'retransmissions': 0,
-            'errors': 0,
-            'start_time': None,
-            'end_time': None
-        }
+        self.packets_sent = 0
+        self.packets_received = 0
+        self.retransmissions = 0
+        self.errors = 0
+        # Marcas de reloj monotónico en nanosegundos (no saltan con NTP)
+        self.start_time = None
+        self.end_time = None
+
+    def _configure_socket_buffers(self, rcvbuf: int, sndbuf: int) -> None:
+        """
+        Agranda los buffers de envío y recepción del socket UDP.
+
+        El kernel puede recortar el valor pedido (net.core.rmem_max / wmem_max);
+        ver protocol.socket_helpers.set_socket_buffer.
+
+        Args:
+            rcvbuf (int): Tamaño pedido para SO_RCVBUF, en bytes.
+            sndbuf (int): Tamaño pedido para SO_SNDBUF, en bytes.
+        """
+        set_socket_buffer(self.sock, socket.SO_RCVBUF, rcvbuf)
+        set_socket_buffer(self.sock, socket.SO_SNDBUF, sndbuf)
+
+    def _configure_path_mtu_discovery(self) -> None:
+        """
+        Activa Path MTU Discovery en modo DO (bit DF) si la plataforma lo soporta.
+
+        Un datagrama más grande que el MTU del camino falla con EMSGSIZE en lugar
+        de fragmentarse en IP, donde perder un fragmento descarta el paquete entero.
+        """
+        if not (hasattr(socket, "IP_MTU_DISCOVER") and hasattr(socket, "IP_PMTUDISC_DO")):
+            return
+        try:
+            self.sock.setsockopt(socket.IPPROTO_IP, socket.IP_MTU_DISCOVER, socket.IP_PMTUDISC_DO)
+        except OSError as e:
+            logger.warning("No se pudo activar Path MTU Discovery: %s", e)
 
     def connect(self) -> bool:
         """
@@ -312,42 +381,48 @@ class RdtClient:
         Returns:
             bool: True si la conexión fue exitosa, False en caso contrario
         """
-        logger.info(f"Iniciando handshake con {self.host}:{self.port}")
-        self.stats['start_time'] = time.time()
+        logger.info("Iniciando handshake con %s:%s", self.host, self.port)
+        self.start_time = monotonic_ns()
+
+        # El handshake no cambia entre intentos: se serializa una sola vez
+        # y los reintentos reenvían los mismos bytes
+        handshake_bytes = self.handshake.create_handshake_request().to_bytes()
         
         for attempt in range(HANDSHAKE_MAX_ATTEMPTS):
             try:
-                logger.info(f"Intento de handshake {attempt + 1}/{HANDSHAKE_MAX_ATTEMPTS}")
+                logger.info("Intento de handshake %s/%s", attempt + 1, HANDSHAKE_MAX_ATTEMPTS)
                 
                 # Enviar handshake inicial
-                handshake_msg = self.handshake.create_handshake_request()
-                self.send(handshake_msg.to_bytes())
+                self.send(handshake_bytes)
+                if attempt:
+                    self.retransmissions += 1
                 logger.info("Handshake inicial enviado")
                 
                 # Esperar respuesta del servidor
-                data, addr, close_signal = self.receive()
+                # Timeout explícito: un receive(timeout=...) previo no debe afectar al handshake
+                data, addr, close_signal = self.receive(timeout=HANDSHAKE_TIMEOUT)
                 
                 if close_signal:
                     logger.error("Servidor envió señal de cierre durante handshake")
                     return False
                 
                 if not data:
-                    logger.warning(f"Timeout esperando respuesta del servidor (intento {attempt + 1})")
+                    logger.warning("Timeout esperando respuesta del servidor (intento %s)", attempt + 1)
                     continue
                 
                 # Parsear respuesta
-                rdt_request = RdtRequest(address=f"{self.host}:{self.port}", request=data)
+                rdt_request = RdtRequest(address=self._server_address, request=data)
                 
                 if self.handshake.parse_handshake_response(rdt_request):
                     self.connected = True
                     logger.info("Conexión establecida exitosamente")
                     return True
                 else:
-                    logger.warning(f"Respuesta de handshake inválida (intento {attempt + 1})")
+                    logger.warning("Respuesta de handshake inválida (intento %s)", attempt + 1)
                     
             except Exception as e:
-                logger.error(f"Error en handshake (intento {attempt + 1}): {e}")
-                self.stats['errors'] += 1
+                logger.error("Error en handshake (intento %s): %s", attempt + 1, e)
+                self.errors += 1
         
         logger.error("No se pudo establecer conexión después de todos los intentos")
         return False
@@ -359,28 +434,57 @@ class RdtClient:
         Args:
             data (bytes): Datos a enviar.
         """
-        with self.lock:
-            self.sock.sendto(data, (self.host, self.port))
-            self.stats['packets_sent'] += 1
+        self.sock.sendto(data, self._peer)
+        self.packets_sent += 1
+
+    def send_iov(self, header: bytes, payload) -> None:
+        """
+        Envía header y payload como un único datagrama sin concatenarlos.
+
+        Args:
+            header (bytes): Header RDT ya empaquetado.
+            payload (bytes | memoryview): Datos del paquete (ver RdtMessage.to_iov).
+        """
+        self.sock.sendmsg((header, payload), (), 0, self._peer)
+        self.packets_sent += 1
 
-    def receive(self) -> Tuple[Optional[bytes], Optional[Tuple[str, int]], bool]:
+    def receive(self, timeout: Optional[float] = None) -> Tuple[Optional[bytes], Optional[Tuple[str, int]], bool]:
         """
         Recibe datos desde el servidor.
 
+        Args:
+            timeout (float | None): Timeout para esta recepción (ej. un RTO por
+                paquete). None mantiene el último configurado; 0 consulta sin
+                bloquear.
+
         Returns:
             tuple:
-                - data (bytes | None): Datos recibidos.
+                - data (bytes | None): Datos recibidos (None si hubo timeout o el
+                  datagrama no entraba en el buffer y se descartó).
                 - addr (tuple[str, int] | None): Dirección del remitente.
                 - close_signal (bool): True si el servidor envió señal de cierre.
         """
+        # settimeout cambia el modo del fd con una syscall: solo si el valor cambia
+        if timeout is not None and timeout != self._timeout:
+            self.sock.settimeout(timeout)
+            self._timeout = timeout
         try:
-            data, addr = self.sock.recvfrom(BUFFER_SIZE)
-            self.stats['packets_received'] += 1
+            nbytes, addr = self.sock.recvfrom_into(self._rx_buf)
+            if nbytes > BUFFER_SIZE:
+                # UDP recorta en silencio lo que no entra: mejor descartarlo que procesarlo
+                logger.warning("Datagrama de %s descartado: supera el máximo de %s bytes "
+                               "y llegó truncado", addr, BUFFER_SIZE)
+                self.errors += 1
+                return None, None, False
+            # Copia única del tamaño exacto: el caller se queda con los datos
+            data = bytes(self._rx_view[:nbytes])
+            self.packets_received += 1
             if self._check_close_signal(data):
                 self.closed_by_server = True
                 return data, addr, True
             return data, addr, False
-        except socket.timeout:
+        except (socket.timeout, BlockingIOError):
+            # Con timeout 0 el socket queda no bloqueante y "sin datos" es BlockingIOError
             return None, None, False
 
     def _check_close_signal(self, data: bytes) -> bool:
@@ -393,11 +497,10 @@ class RdtClient:
         Returns:
             bool: True si indica cerrar conexión.
         """
-        try:
-            dp = DPRequest(data)
-            return dp.function_flag == FunctionFlag.CLOSE_CONN
-        except Exception:
-            return False
+        # Alcanza con mirar el prefijo y que exista el separador del uuid;
+        # no hace falta construir un DPRequest completo por paquete
+        return (data.startswith(_CLOSE_PREFIX)
+                and data.find(b"_", len(_CLOSE_PREFIX)) != -1)
 
     def is_connected(self) -> bool:
         """
@@ -423,6 +526,30 @@ class RdtClient:
             'is_go_back_n': self.handshake.is_go_back_n()
         }
 
+    @property
+    def stats(self) -> Mapping[str, Any]:
+        """
+        Vista de solo lectura de los contadores, armada al momento de consultarla.
+
+        Es un MappingProxyType: escribir (ej. stats['errors'] += 1) lanza TypeError
+        en lugar de perderse en silencio; los contadores se actualizan por atributo.
+
+        Returns:
+            Mapping: Contadores y marcas de tiempo de la conexión
+        """
+        return MappingProxyType(self._stats_snapshot())
+
+    def _stats_snapshot(self) -> Dict[str, Any]:
+        """Arma un dict nuevo con los valores actuales de los contadores."""
+        return {
+            'packets_sent': self.packets_sent,
+            'packets_received': self.packets_received,
+            'retransmissions': self.retransmissions,
+            'errors': self.errors,
+            'start_time': self.start_time,
+            'end_time': self.end_time
+        }
+
     def get_stats(self) -> Dict[str, Any]:
         """
         Obtiene estadísticas de la conexión.
@@ -430,16 +557,18 @@ class RdtClient:
         Returns:
             dict: Estadísticas de la conexión
         """
-        if self.stats['start_time'] and self.stats['end_time']:
-            self.stats['duration'] = self.stats['end_time'] - self.stats['start_time']
-        return self.stats.copy()
+        stats = self._stats_snapshot()
+        if self.start_time is not None and self.end_time is not None:
+            stats['duration_ns'] = self.end_time - self.start_time
+            stats['duration'] = stats['duration_ns'] / 1e9  # Segundos
+        return stats
 
     def close(self):
         """
         Cierra el socket.
         """
         self.connected = False
-        self.stats['end_time'] = time.time()
+        self.end_time = monotonic_ns()
         self.sock.close()
         logger.info("Conexión cerrada")
 
@@ -454,11 +583,8 @@ def calculate_file_hash(file_path: Path) -> str:
     Returns:
         str: Hash MD5 del archivo
     """
-    hash_md5 = hashlib.md5()
     with open(file_path, "rb") as f:
-        for chunk in iter(lambda: f.read(4096), b""):
-            hash_md5.update(chunk)
-    return hash_md5.hexdigest()
+        return hashlib.file_digest(f, "md5").hexdigest()
 
 
 def validate_file_size(file_path: Path, max_size_mb: int = MAX_FILE_SIZE_MB) -> Tuple[bool, Optional[int]]:
@@ -479,23 +605,29 @@ def validate_file_size(file_path: Path, max_size_mb: int = MAX_FILE_SIZE_MB) ->
     return True, None
 
 
-def create_upload_request(filename: str, file_size: int, protocol: str, window_size: int = 1) -> bytes:
+def create_upload_request(filename: str, file_size: int, protocol: str, window_size: int = 1,
+                          chunk_size: int = CHUNK_SIZE) -> bytes:
     """
     Crea un mensaje de solicitud de upload usando RdtMessage.
     
     Args:
         filename (str): Nombre del archivo
         file_size (int): Tamaño del archivo en bytes
-        protocol (str): Protocolo a usar ("stop-and-wait" o "go-back-n")
+        protocol (str): Protocolo a usar (uno de PROTOCOLS)
         window_size (int): Tamaño de ventana
+        chunk_size (int): Tamaño de payload por paquete (1 a CHUNK_SIZE)
         
     Returns:
         bytes: Mensaje de solicitud formateado
     """
+    # BUFFER_SIZE se dimensiona con CHUNK_SIZE: un chunk mayor llegaría truncado
+    if chunk_size < 1 or chunk_size > CHUNK_SIZE:
+        raise ValueError(f"chunk_size debe estar entre 1 y {CHUNK_SIZE}")
+
     # Crear un mensaje de handshake con la información del upload
     # El servidor interpretará esto como una solicitud de upload
-    proto_code = PROTO_STOP_WAIT if protocol == "stop-and-wait" else PROTO_GBN
-    request_data = f"{filename}|{file_size}|{proto_code}|{window_size}|{CHUNK_SIZE}".encode('utf-8')
+    proto_code = PROTOCOL_CODES.get(protocol, PROTO_GBN)
+    request_data = f"{filename}|{file_size}|{proto_code}|{window_size}|{chunk_size}".encode('utf-8')
     
     upload_msg = RdtMessage(
         flag=FLAG_DATA,
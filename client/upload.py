@@ -10,6 +10,8 @@ import sys
 import re
 from pathlib import Path
 
+from .protocols import PROTOCOLS
+
 def parse_args():
     """Parsea argumentos de línea de comandos"""
     parser = argparse.ArgumentParser(
@@ -32,8 +34,8 @@ def parse_args():
     parser.add_argument("-n", "--name", metavar="FILENAME",
                         help="file name")
     parser.add_argument("-r", "--protocol", metavar="protocol",
-                        choices=["stop-and-wait", "go-back-n"], 
-                        default="stop-and-wait",
+                        choices=PROTOCOLS,
+                        default=PROTOCOLS[0],
                         help="error recovery protocol")
 
     return parser.parse_args()
@@ -1,4 +1,3 @@
-from typing import Dict, Any
 import logging
 
 # Configurar logger local para evitar importación circular
@@ -12,7 +11,7 @@ class DataHandler:
         self.connection_lock = {}
     
     def handle_data(self, data: bytes) -> bytes:
-        logger.info(f"Recibido paquete de datos: {data}")
+        logger.debug("Recibido paquete de datos: %s", data)
         return data
         
 
@@ -1,8 +1,7 @@
 from abc import ABC, abstractmethod
 from queue import Queue, Empty
-from server.server_helpers import get_udp_socket
-from .rdt_message import RdtRequest, RdtResponse
-from typing import Optional, Dict
+from .rdt_message import RdtRequest, RdtResponse, FLAG_DATA
+from typing import Optional, Dict, Tuple
 import time
 import logging
 from protocol.data_handler.data_handler import DataHandler
@@ -10,7 +9,6 @@ import socket
 import threading
 
 # Configurar logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 # ================================[CONSTANTES]===============================
@@ -19,16 +17,14 @@ CONNECTION_TIMEOUT = 30  # 30 segundos de timeout de conexión
 DATA_WAIT_TIMEOUT = 5    # 5 segundos esperando primer paquete de datos después del handshake
 DATA_WAIT_MAX_ATTEMPTS = 3  # Máximo 3 intentos de reenvío del ACK
 
-# FLAGS
-FLAG_HANDSHAKE = 0
-FLAG_ACK = 1
-FLAG_DATA = 0  # DATA usa el mismo flag que HANDSHAKE pero con datos
-FLAG_LAST = 2
+# FLAGS (FLAG_DATA y el resto de los flags se definen en rdt_message)
+FLAG_HANDSHAKE = 0  # DATA usa el mismo flag que HANDSHAKE pero con datos
 
 # ================================[CLASE PRINCIPAL]===============================
 class RdtConnection:
-    def __init__(self, address: str):
-        self.address: str = address
+    def __init__(self, address: str, peer: Tuple[str, int]):
+        self.address: str = address  # "host:port", para logs y RdtRequest
+        self.peer: Tuple[str, int] = peer  # Tupla de recvfrom: destino de las respuestas
         self.seq_num: Optional[int] = None
         self.ref_num: Optional[int] = None
         self.max_window: Optional[int] = None
@@ -174,10 +170,9 @@ class RdtConnection:
             if not response:
                 raise ValueError("Response vacío")
             
-            host, port = self.address.split(":")
             # Crear socket temporal para enviar respuesta
             sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-            sock.sendto(response, (host, int(port)))
+            sock.sendto(response, self.peer)
             sock.close()
         except Exception as e:
             logger.error(f"Error enviando respuesta a {self.address}: {e}")
@@ -314,28 +309,29 @@ class RdtConnection:
 # ================================[REPOSITORIO ABSTRACTO]===============================
 class RdtConnectionRepository(ABC):
     @abstractmethod
-    def get_connection(self, address: str) -> Optional['RdtConnection']:
+    def get_connection(self, address: Tuple[str, int]) -> Optional['RdtConnection']:
         pass
 
     @abstractmethod
-    def remove_connection(self, address: str) -> None:
+    def remove_connection(self, address: Tuple[str, int]) -> None:
         pass
 
     @abstractmethod
-    def add_connection(self, address: str, connection: 'RdtConnection') -> None:
+    def add_connection(self, address: Tuple[str, int], connection: 'RdtConnection') -> None:
         pass
 
 # ================================[REPOSITORIO EN MEMORIA]===============================
 class MemoryRdtConnectionRepository(RdtConnectionRepository):
     def __init__(self):
-        self.connections: Dict[str, RdtConnection] = {}
+        # Indexado por la tupla (ip, puerto) que devuelve recvfrom
+        self.connections: Dict[Tuple[str, int], RdtConnection] = {}
 
-    def get_connection(self, address: str) -> Optional[RdtConnection]:
+    def get_connection(self, address: Tuple[str, int]) -> Optional[RdtConnection]:
         return self.connections.get(address)
 
-    def add_connection(self, address: str, connection: RdtConnection) -> None:
+    def add_connection(self, address: Tuple[str, int], connection: RdtConnection) -> None:
         if address not in self.connections:
             self.connections[address] = connection
 
-    def remove_connection(self, address: str) -> None:
+    def remove_connection(self, address: Tuple[str, int]) -> None:
         self.connections.pop(address, None)
@@ -1,9 +1,16 @@
+import struct
+
 # Tipos de mensaje y flags (consistentes con el servidor)
 # El servidor usa: FLAG_ACK = 1, FLAG_DATA = 0, FLAG_LAST = 2
 FLAG_ACK = 1        # Para ACK
 FLAG_DATA = 0       # Para datos
 FLAG_LAST = 2       # Para último paquete
 
+# Header: [FLAG_BYTE][MAX WINDOW BYTE][SEQ_NUM: 8 bytes][REF_NUM: 8 bytes], big endian.
+# Se compila una sola vez para no reinterpretar el formato en cada paquete.
+_HEADER = struct.Struct(">BBQQ")
+HEADER_SIZE = _HEADER.size
+
 class RdtMessage:
     
     def __init__(self, flag: int, max_window: int, seq_num: int, ref_num: int, data: bytes):
@@ -21,31 +28,21 @@ class RdtMessage:
     #[REF_NUM]: 8 bytes
     @classmethod
     def from_bytes(cls, raw: bytes) -> "RdtMessage":
-        # Flag = primer byte
-        flag = raw[0]  # 0, 1, 2, 3
-        # MaxWindow = segundo byte
-        max_window = int.from_bytes(raw[1:2], byteorder="big")
-        # Seq Num = tercero a décimo byte (inclusive) - 8 bytes
-        seq_num = int.from_bytes(raw[2:10], byteorder="big")
-        # Ref Num = undécimo a decimoctavo byte (inclusive) - 8 bytes
-        ref_num = int.from_bytes(raw[10:18], byteorder="big")
+        # Flag, MaxWindow, Seq Num y Ref Num salen del header fijo de 18 bytes
+        flag, max_window, seq_num, ref_num = _HEADER.unpack_from(raw)
         # Data = decimonoveno byte en adelante (inclusive)
-        data = raw[18:]
+        data = raw[HEADER_SIZE:]
 
         return cls(flag, max_window, seq_num, ref_num, data)
 
     def to_bytes(self) -> bytes:
-        # Armamos el flag byte
-        flag_byte = self.flag.to_bytes(1, byteorder='big')
-        # Armamos el max window byte
-        max_window_byte = self.max_window.to_bytes(1, byteorder='big')
-        # Armamos el seq num bytes
-        seq_num_bytes = self.seq_num.to_bytes(8, byteorder='big')
-        # Armamos el ref num bytes
-        ref_num_bytes = self.ref_num.to_bytes(8, byteorder='big')
+        # Armamos el header en una sola llamada y concatenamos los datos
+        return _HEADER.pack(self.flag, self.max_window, self.seq_num, self.ref_num) + self.data
 
-        # Concatenamos
-        return flag_byte + max_window_byte + seq_num_bytes + ref_num_bytes + self.data
+    def to_iov(self) -> tuple:
+        # Header y datos por separado para sendmsg: el kernel los junta sin copiar el payload
+        header = _HEADER.pack(self.flag, self.max_window, self.seq_num, self.ref_num)
+        return header, memoryview(self.data)
 
 class RdtResponse:
     def __init__(self, flag: int, max_window: int, seq_num: int, ref_num: int, data: bytes):
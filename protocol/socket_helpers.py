@@ -0,0 +1,44 @@
+import logging
+import socket
+import sys
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+# Tamaños por defecto pedidos al kernel: evitan descartes en ráfagas de Go-Back-N
+SOCKET_RCVBUF_SIZE = 8 * 1024 * 1024
+SOCKET_SNDBUF_SIZE = 4 * 1024 * 1024
+
+# Límite del kernel que recorta cada opción
+_BUFFER_SYSCTLS = {
+    socket.SO_RCVBUF: "net.core.rmem_max",
+    socket.SO_SNDBUF: "net.core.wmem_max",
+}
+
+# Linux duplica el valor pedido (reserva para bookkeeping) y getsockopt devuelve el doble
+_KERNEL_DOUBLES_BUFFERS = sys.platform.startswith("linux")
+
+
+def set_socket_buffer(skt: socket.socket, option: int, size: int) -> Optional[int]:
+    """
+    Pide `size` bytes para SO_RCVBUF o SO_SNDBUF.
+
+    Si el kernel recorta el valor (net.core.rmem_max / wmem_max) se loguea a nivel
+    info con el sysctl a subir; no es un error, el socket sigue funcionando.
+
+    Returns:
+        int | None: Tamaño efectivo otorgado (sin el duplicado de Linux), o None si falló.
+    """
+    try:
+        skt.setsockopt(socket.SOL_SOCKET, option, size)
+        reported = skt.getsockopt(socket.SOL_SOCKET, option)
+    except OSError as e:
+        logger.warning("No se pudo configurar el buffer del socket: %s", e)
+        return None
+
+    granted = reported // 2 if _KERNEL_DOUBLES_BUFFERS else reported
+    logger.debug("Buffer del socket configurado: %s bytes (pedido: %s)", granted, size)
+    if granted < size:
+        logger.info("Buffer del socket limitado por el kernel: %s bytes (pedido: %s). "
+                    "Considere 'sysctl -w %s=%s'", granted, size, _BUFFER_SYSCTLS.get(option), size)
+    return granted
@@ -1,7 +1,11 @@
+import logging
+import socket
 import threading
-from typing import Callable, Optional
 from .server_helpers import get_udp_socket
 from protocol.rdt.rdt_connection import RdtConnectionRepository, RdtConnection
+from protocol.socket_helpers import SOCKET_RCVBUF_SIZE, set_socket_buffer
+
+logger = logging.getLogger(__name__)
 
 class RDTServer:
     def __init__(self, host: str, port: int, buffer_size: int, conn_repo: RdtConnectionRepository = None):
@@ -16,22 +20,26 @@ class RDTServer:
     def serve(self) -> None:
         self._skt = get_udp_socket(self._host, self._port)
         self._skt.setblocking(True)
+        # Todos los clientes llegan a este socket; las respuestas salen por sockets propios
+        set_socket_buffer(self._skt, socket.SO_RCVBUF, SOCKET_RCVBUF_SIZE)
 
         print(f"RDT server listening on {self._host}:{self._port}")
         try:
             while self._is_running:
                 data, address = self._skt.recvfrom(self._recv_buffer_size)
-                str_address = f"{address[0]}:{address[1]}"
 
-                connection = self._conn_repo.get_connection(str_address)
+                # Las conexiones se indexan por la tupla de recvfrom: sin formatear por datagrama
+                connection = self._conn_repo.get_connection(address)
                 if connection:
                     connection.add_request(data)
-                    print(f"[RDT] Petición añadida a conexión existente {str_address}")
+                    # Se dispara una vez por datagrama: solo a nivel debug (-v)
+                    logger.debug("[RDT] Petición añadida a conexión existente %s", connection.address)
                 else:
                     # Crear nueva conexión sin hilo
-                    connection = RdtConnection(address=str_address)
+                    str_address = f"{address[0]}:{address[1]}"
+                    connection = RdtConnection(address=str_address, peer=address)
                     connection.add_request(data)
-                    self._conn_repo.add_connection(str_address, connection)
+                    self._conn_repo.add_connection(address, connection)
                     
                     # Crear y manejar hilo para esta conexión
                     connection_thread = threading.Thread(
@@ -1,5 +1,6 @@
 from . import rdt_server
 import argparse
+import logging
 from protocol.rdt.rdt_connection import MemoryRdtConnectionRepository
 
 def parse_args():
@@ -23,6 +24,8 @@ def parse_args():
 def main():
     args = parse_args()
 
+    logging.basicConfig(level=logging.DEBUG if args.verbose else logging.INFO)
+
     if args.verbose:
         print(f"[INFO] Iniciando servidor en {args.host}:{args.port}")
     elif args.quiet:
@@ -57,6 +57,37 @@ class TestDownload(unittest.TestCase):
         result = validate_destination(str(self.temp_file))
         self.assertEqual(result, self.temp_file)
     
+    def test_validate_destination_under_regular_file(self):
+        """Test que una ruta bajo un archivo (ENOTDIR) se rechaza"""
+        self.temp_file.write_text("contenido existente")
+        target = self.temp_file / "file.txt"
+
+        with self.assertRaises(NotADirectoryError):
+            validate_destination(str(target))
+
+    def test_validate_destination_directory_with_name(self):
+        """Test que con un directorio y un nombre devuelve el archivo final"""
+        result = validate_destination(str(self.temp_dir), "file.txt")
+        self.assertEqual(result, Path(self.temp_dir) / "file.txt")
+
+    def test_validate_destination_file_ignores_name(self):
+        """Test que con una ruta de archivo el nombre no se agrega"""
+        target_file = Path(self.temp_dir) / "new_file.txt"
+
+        result = validate_destination(str(target_file), "file.txt")
+        self.assertEqual(result, target_file)
+
+    def test_validate_destination_symlink_loop(self):
+        """Test que un bucle de symlinks (ELOOP) se trata como destino inexistente"""
+        loop = Path(self.temp_dir) / "loop"
+        os.symlink(loop, loop)
+
+        try:
+            result = validate_destination(str(loop))
+            self.assertEqual(result, loop)
+        finally:
+            loop.unlink()
+
     def test_validate_destination_readonly_directory(self):
         """Test que validate_destination falla con directorio sin permisos de escritura"""
         self.temp_subdir.mkdir()
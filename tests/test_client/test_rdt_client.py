@@ -8,6 +8,8 @@ import os
 import socket
 import threading
 import time
+import uuid
+from collections.abc import Mapping
 from pathlib import Path
 from unittest.mock import patch, MagicMock, Mock
 
@@ -20,7 +22,8 @@ from client.rdt_client import (
     get_error_message, ERR_TOO_BIG, ERR_NOT_FOUND, ERR_BAD_REQUEST,
     ERR_PERMISSION_DENIED, ERR_NETWORK_ERROR, ERR_TIMEOUT_ERROR,
     ERR_INVALID_PROTOCOL, ERR_SERVER_ERROR,
-    FLAG_DATA, FLAG_ACK, FLAG_LAST, PROTO_STOP_WAIT, PROTO_GBN
+    FLAG_DATA, FLAG_ACK, FLAG_LAST, PROTO_STOP_WAIT, PROTO_GBN,
+    BUFFER_SIZE, CHUNK_SIZE
 )
 from protocol.rdt.rdt_message import RdtMessage, RdtRequest
 
@@ -153,6 +156,8 @@ class TestRdtHandshake(unittest.TestCase):
         
         self.assertFalse(result)
         self.assertFalse(self.handshake.handshake_completed)
+        self.assertIsNone(self.handshake.server_sequence_number)
+        self.assertEqual(self.handshake.reference_number, 0)
 
 
 class TestConnectionState(unittest.TestCase):
@@ -246,7 +251,7 @@ class TestRdtClient(unittest.TestCase):
         self.assertIsInstance(self.client.handshake, RdtHandshake)
         self.assertFalse(self.client.connected)
         self.assertFalse(self.client.closed_by_server)
-        self.assertIsInstance(self.client.stats, dict)
+        self.assertIsInstance(self.client.stats, Mapping)
     
     def test_client_initialization_with_max_window(self):
         """Test inicialización con max_window personalizado"""
@@ -256,6 +261,18 @@ class TestRdtClient(unittest.TestCase):
         self.assertEqual(client.port, 8888)
         self.assertEqual(client.handshake.max_window, 5)
         client.sock.close()
+
+    @patch('socket.socket')
+    def test_client_initialization_with_socket_buffers(self, mock_socket):
+        """Test que los tamaños de buffer pedidos se aplican al socket"""
+        mock_sock = Mock()
+        mock_sock.getsockopt.return_value = 2 * 65536
+        mock_socket.return_value = mock_sock
+
+        RdtClient(host="127.0.0.1", port=9999, rcvbuf=65536, sndbuf=32768)
+
+        mock_sock.setsockopt.assert_any_call(socket.SOL_SOCKET, socket.SO_RCVBUF, 65536)
+        mock_sock.setsockopt.assert_any_call(socket.SOL_SOCKET, socket.SO_SNDBUF, 32768)
     
     def test_get_handshake_info(self):
         """Test obtención de información de handshake"""
@@ -285,6 +302,15 @@ class TestRdtClient(unittest.TestCase):
         self.assertIn('start_time', stats)
         self.assertIn('end_time', stats)
     
+    def test_stats_is_read_only(self):
+        """Test que escribir en stats falla en lugar de perderse en silencio"""
+        with self.assertRaises(TypeError):
+            self.client.stats['retransmissions'] += 1
+
+        self.client.retransmissions += 1
+        self.assertEqual(self.client.stats['retransmissions'], 1)
+        self.assertEqual(self.client.get_stats()['retransmissions'], 1)
+
     def test_is_connected_before_handshake(self):
         """Test estado de conexión antes del handshake"""
         self.assertFalse(self.client.is_connected())
@@ -309,6 +335,30 @@ class TestRdtClient(unittest.TestCase):
         mock_sock.sendto.assert_called_once_with(test_data, ("127.0.0.1", 9999))
         self.assertEqual(self.client.stats['packets_sent'], 1)
     
+    def test_connect_retries_resend_same_handshake(self):
+        """Test que los reintentos de handshake reenvían los mismos bytes"""
+        mock_sock = Mock()
+        mock_sock.recvfrom_into.side_effect = socket.timeout()
+        self.client.sock = mock_sock
+
+        self.assertFalse(self.client.connect())
+
+        sent = [call.args[0] for call in mock_sock.sendto.call_args_list]
+        self.assertEqual(len(sent), 3)
+        self.assertEqual(len(set(sent)), 1)
+        self.assertEqual(self.client.stats['retransmissions'], 2)
+
+    def test_send_iov(self):
+        """Test envío de header y payload como iovec sin concatenar"""
+        mock_sock = Mock()
+        self.client.sock = mock_sock
+
+        header, payload = RdtMessage(FLAG_DATA, 1, 1, 1, b"chunk").to_iov()
+        self.client.send_iov(header, payload)
+
+        mock_sock.sendmsg.assert_called_once_with((header, payload), (), 0, ("127.0.0.1", 9999))
+        self.assertEqual(self.client.stats['packets_sent'], 1)
+
     @patch('socket.socket')
     def test_receive_data(self, mock_socket):
         """Test recepción de datos"""
@@ -317,7 +367,11 @@ class TestRdtClient(unittest.TestCase):
         self.client.sock = mock_sock
         
         # Simular recepción de datos
-        mock_sock.recvfrom.return_value = (b"response data", ("127.0.0.1", 9999))
+        def fake_recvfrom_into(buf):
+            payload = b"response data"
+            buf[:len(payload)] = payload
+            return len(payload), ("127.0.0.1", 9999)
+        mock_sock.recvfrom_into.side_effect = fake_recvfrom_into
         
         data, addr, close_signal = self.client.receive()
         
@@ -334,14 +388,99 @@ class TestRdtClient(unittest.TestCase):
         self.client.sock = mock_sock
         
         # Simular timeout
-        mock_sock.recvfrom.side_effect = socket.timeout()
+        mock_sock.recvfrom_into.side_effect = socket.timeout()
         
         data, addr, close_signal = self.client.receive()
         
         self.assertIsNone(data)
         self.assertIsNone(addr)
         self.assertFalse(close_signal)
-    
+
+    def test_receive_timeout_only_applied_when_changed(self):
+        """Test que el timeout por llamada solo reconfigura el socket si cambia"""
+        mock_sock = Mock()
+        mock_sock.recvfrom_into.side_effect = socket.timeout()
+        self.client.sock = mock_sock
+
+        self.client.receive()
+        self.client.receive(timeout=0.5)
+        self.client.receive(timeout=0.5)
+
+        mock_sock.settimeout.assert_called_once_with(0.5)
+
+    def test_receive_zero_timeout_without_data(self):
+        """Test que timeout=0 sin datos disponibles devuelve vacío en lugar de lanzar"""
+        data, addr, close_signal = self.client.receive(timeout=0)
+
+        self.assertIsNone(data)
+        self.assertIsNone(addr)
+        self.assertFalse(close_signal)
+        self.assertEqual(self.client.sock.gettimeout(), 0.0)
+
+    def test_connect_after_zero_timeout_receive_waits_for_ack(self):
+        """Test que connect espera el ACK aunque antes se haya usado receive(timeout=0)"""
+        server = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        server.bind(("127.0.0.1", 0))
+        self.addCleanup(server.close)
+        client = RdtClient(host="127.0.0.1", port=server.getsockname()[1])
+        self.addCleanup(client.sock.close)
+
+        def reply_late():
+            _, addr = server.recvfrom(1024)
+            time.sleep(0.2)  # El ACK llega después de que un socket no bloqueante se rendiría
+            server.sendto(RdtMessage(FLAG_ACK, 1, 0, 1, b'').to_bytes(), addr)
+        responder = threading.Thread(target=reply_late, daemon=True)
+        responder.start()
+
+        client.receive(timeout=0)
+        self.assertTrue(client.connect())
+        responder.join(timeout=1)
+
+    def test_receive_accepts_dp_framed_full_chunk(self):
+        """Test que un chunk completo con framing DP se recibe entero, sin marcarse truncado"""
+        dp_payload = b"1_" + str(uuid.uuid4()).encode() + b"_" + b"x" * CHUNK_SIZE
+        packet = RdtMessage(FLAG_DATA, 1, 1, 1, dp_payload).to_bytes()
+        mock_sock = Mock()
+        def fake_recvfrom_into(buf):
+            n = min(len(packet), len(buf))
+            buf[:n] = packet[:n]
+            return n, ("127.0.0.1", 9999)
+        mock_sock.recvfrom_into.side_effect = fake_recvfrom_into
+        self.client.sock = mock_sock
+
+        data, _, _ = self.client.receive()
+
+        self.assertEqual(len(packet), BUFFER_SIZE)
+        self.assertEqual(data, packet)
+        self.assertEqual(self.client.stats['errors'], 0)
+
+    def test_receive_discards_truncated_datagram(self):
+        """Test que un datagrama que llena el byte extra del buffer se descarta como truncado"""
+        mock_sock = Mock()
+        def fake_recvfrom_into(buf):
+            buf[:] = b"x" * len(buf)
+            return len(buf), ("127.0.0.1", 9999)
+        mock_sock.recvfrom_into.side_effect = fake_recvfrom_into
+        self.client.sock = mock_sock
+
+        data, addr, close_signal = self.client.receive()
+
+        self.assertIsNone(data)
+        self.assertIsNone(addr)
+        self.assertFalse(close_signal)
+        self.assertEqual(self.client.stats['packets_received'], 0)
+        self.assertEqual(self.client.stats['errors'], 1)
+
+    def test_check_close_signal(self):
+        """Test detección de CLOSE_CONN sin parsear el DPRequest completo"""
+        self.assertTrue(self.client._check_close_signal(b"1_abc-uuid_"))
+        self.assertTrue(self.client._check_close_signal(b"1_abc-uuid_payload"))
+        self.assertFalse(self.client._check_close_signal(b"0_abc-uuid_payload"))
+        self.assertFalse(self.client._check_close_signal(b"10_abc-uuid_payload"))
+        self.assertFalse(self.client._check_close_signal(b"1_sin-separador"))
+        self.assertFalse(self.client._check_close_signal(b"response data"))
+        self.assertFalse(self.client._check_close_signal(b""))
+
     def test_close_connection(self):
         """Test cierre de conexión"""
         # Simular que el socket está abierto
@@ -353,6 +492,17 @@ class TestRdtClient(unittest.TestCase):
         self.assertFalse(self.client.connected)
         self.assertIsNotNone(self.client.stats['end_time'])
 
+    def test_get_stats_duration_monotonic(self):
+        """Test duración calculada con el reloj monotónico en nanosegundos"""
+        self.client.start_time = time.monotonic_ns()
+        self.client.close()
+
+        stats = self.client.get_stats()
+
+        self.assertIsInstance(stats['duration_ns'], int)
+        self.assertGreaterEqual(stats['duration_ns'], 0)
+        self.assertAlmostEqual(stats['duration'], stats['duration_ns'] / 1e9)
+
 
 class TestUtilityFunctions(unittest.TestCase):
     """Tests para funciones utilitarias"""
@@ -452,7 +602,32 @@ class TestUtilityFunctions(unittest.TestCase):
         # Verificar que se puede parsear
         rdt_request = RdtRequest(address="127.0.0.1:9999", request=request_bytes)
         self.assertEqual(rdt_request.get_max_window(), 5)
-    
+
+    def test_create_upload_request_custom_chunk_size(self):
+        """Test que create_upload_request anuncia el chunk size pedido"""
+        request_bytes = create_upload_request(
+            filename="test.txt",
+            file_size=2048,
+            protocol="go-back-n",
+            window_size=5,
+            chunk_size=512
+        )
+
+        rdt_request = RdtRequest(address="127.0.0.1:9999", request=request_bytes)
+        self.assertEqual(rdt_request.get_data(), b"test.txt|2048|1|5|512")
+
+    def test_create_upload_request_rejects_oversized_chunk(self):
+        """Test que create_upload_request rechaza chunks que el receptor no puede aceptar"""
+        for chunk_size in (0, CHUNK_SIZE + 1):
+            with self.assertRaises(ValueError):
+                create_upload_request(
+                    filename="test.txt",
+                    file_size=2048,
+                    protocol="go-back-n",
+                    window_size=5,
+                    chunk_size=chunk_size
+                )
+
     def test_get_error_message_valid_codes(self):
         """Test obtención de mensajes de error válidos"""
         self.assertEqual(get_error_message(ERR_TOO_BIG), "Archivo excede el tamaño máximo permitido")
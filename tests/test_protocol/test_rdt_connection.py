@@ -0,0 +1,26 @@
+import unittest
+from protocol.rdt.rdt_connection import RdtConnection, MemoryRdtConnectionRepository
+
+class TestRdtConnection(unittest.TestCase):
+    def test_connection_uses_recvfrom_peer(self):
+        """Test que la conexión responde a la tupla de recvfrom sin parsear el string"""
+        connection = RdtConnection(address="127.0.0.1:5000", peer=("127.0.0.1", 5000))
+
+        self.assertEqual(connection.peer, ("127.0.0.1", 5000))
+        self.assertEqual(connection.address, "127.0.0.1:5000")
+
+    def test_repository_keyed_by_address_tuple(self):
+        """Test que el repositorio indexa por la tupla (ip, puerto) de recvfrom"""
+        repo = MemoryRdtConnectionRepository()
+        peer = ("127.0.0.1", 5000)
+        connection = RdtConnection(address="127.0.0.1:5000", peer=peer)
+
+        repo.add_connection(peer, connection)
+
+        self.assertIs(repo.get_connection(("127.0.0.1", 5000)), connection)
+        self.assertIsNone(repo.get_connection(("127.0.0.1", 5001)))
+        repo.remove_connection(peer)
+        self.assertIsNone(repo.get_connection(peer))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,6 +1,7 @@
+import struct
 import unittest
 from protocol.rdt import RdtRequest
-from protocol.rdt.rdt_message import RdtMessage
+from protocol.rdt.rdt_message import RdtMessage, HEADER_SIZE
 
 class TestRDTRequest(unittest.TestCase):
     def test_rdt_request_data_packet(self):
@@ -119,5 +120,28 @@ class TestRDTRequest(unittest.TestCase):
         
         self.assertEqual(rdt_request.address, "192.168.1.100:9000")
 
+    def test_rdt_message_wire_layout(self):
+        """Test que el header se serializa como flag, ventana, seq y ref big endian"""
+        rdt_message = RdtMessage(flag=2, max_window=5, seq_num=0x0102, ref_num=0x0304, data=b'xy')
+
+        self.assertEqual(
+            rdt_message.to_bytes(),
+            b'\x02\x05' + (0x0102).to_bytes(8, 'big') + (0x0304).to_bytes(8, 'big') + b'xy'
+        )
+
+    def test_rdt_message_to_iov_matches_to_bytes(self):
+        """Test que header + payload de to_iov forman el mismo datagrama que to_bytes"""
+        rdt_message = RdtMessage(flag=0, max_window=3, seq_num=7, ref_num=8, data=b'payload')
+
+        header, payload = rdt_message.to_iov()
+
+        self.assertEqual(len(header), HEADER_SIZE)
+        self.assertEqual(header + bytes(payload), rdt_message.to_bytes())
+
+    def test_rdt_request_truncated_header(self):
+        """Test que un paquete más corto que el header se rechaza"""
+        with self.assertRaises(struct.error):
+            RdtRequest(address="127.0.0.1:8080", request=b'\x01\x01\x00')
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,41 @@
+import socket
+import unittest
+from unittest.mock import Mock, patch
+from protocol import socket_helpers
+from protocol.socket_helpers import set_socket_buffer
+
+class TestSetSocketBuffer(unittest.TestCase):
+    def test_linux_doubled_value_is_not_a_clamp(self):
+        """Test que el valor duplicado que reporta Linux se toma como otorgado completo"""
+        skt = Mock()
+        skt.getsockopt.return_value = 2 * 65536
+
+        with patch.object(socket_helpers, "_KERNEL_DOUBLES_BUFFERS", True), \
+             self.assertNoLogs(socket_helpers.logger, level="INFO"):
+            granted = set_socket_buffer(skt, socket.SO_RCVBUF, 65536)
+
+        skt.setsockopt.assert_called_once_with(socket.SOL_SOCKET, socket.SO_RCVBUF, 65536)
+        self.assertEqual(granted, 65536)
+
+    def test_clamp_detected_despite_doubling(self):
+        """Test que un pedido recortado por rmem_max se detecta aunque el reporte sea el doble"""
+        skt = Mock()
+        skt.getsockopt.return_value = 2 * 4 * 1024 * 1024  # rmem_max = 4 MiB
+
+        with patch.object(socket_helpers, "_KERNEL_DOUBLES_BUFFERS", True), \
+             self.assertLogs(socket_helpers.logger, level="INFO") as logs:
+            granted = set_socket_buffer(skt, socket.SO_RCVBUF, 8 * 1024 * 1024)
+
+        self.assertEqual(granted, 4 * 1024 * 1024)
+        self.assertIn("net.core.rmem_max", logs.output[-1])
+        self.assertEqual(logs.records[-1].levelname, "INFO")
+
+    def test_setsockopt_error_returns_none(self):
+        """Test que un error de setsockopt no se propaga"""
+        skt = Mock()
+        skt.setsockopt.side_effect = OSError("no soportado")
+
+        self.assertIsNone(set_socket_buffer(skt, socket.SO_SNDBUF, 65536))
+
+if __name__ == '__main__':
+    unittest.main()